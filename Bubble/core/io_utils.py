@@ -1,42 +1,165 @@
 # examples/utils.py
+import csv
+import warnings
 from pathlib import Path
+import numpy as np
 import pandas as pd
+def _ts_blocks(results: dict) -> list:
+    """
+    Split `results["results"]["ts"]` into 1-D (model, bubble diameter, TS)
+    blocks, one per model or, for a diameter array, one per model and
+    diameter (diameters inner). Raises ValueError, before anything is
+    written, when the TS arrays do not match the frequency/diameter axes.
+    """
+    params = results["params"]
+    n_f = len(params["frequencies"])
+    blocks = []
+    for model, ts_vals in results["results"]["ts"].items():
+        ts_vals = np.asarray(ts_vals)
+        if ts_vals.ndim == 1:
+            # one sweep for the single (scalar) diameter `d`
+            blocks.append((model, np.asarray(params["d"], dtype=float).item(), ts_vals))
+        elif ts_vals.ndim == 2:
+            # (n_diameters, n_freq) from run_calculations with an array `d`
+            diameters = np.atleast_1d(np.asarray(params["d"], dtype=float)).tolist()
+            if len(diameters) != ts_vals.shape[0]:
+                raise ValueError(f"TS for model '{model}' has {ts_vals.shape[0]} diameter rows, "
+                                 f"but params['d'] has {len(diameters)} diameters")
+            blocks.extend(zip([model] * len(diameters), diameters, ts_vals))
+        else:
+            raise ValueError(f"TS for model '{model}' must be 1-D or 2-D, got shape {ts_vals.shape}")
+        if ts_vals.shape[-1] != n_f:
+            raise ValueError(f"TS for model '{model}' has {ts_vals.shape[-1]} frequencies, expected {n_f}")
+    return blocks
+
+def _environment_columns(results: dict) -> dict:
+    """Environment fields of `results["params"]` (dataclass or dict), if present"""
+    env = results["params"].get("environment")
+    if env is not None:
+        if hasattr(env, "__dict__"):
+            return dict(env.__dict__)
+        elif isinstance(env, dict):
+            return dict(env)
+    return {}
+
 def export_results_csv(results: dict, outpath: Path) -> None:
     """
     Flatten the `results` dict from `run_calculations` into a long-form
     DataFrame and write it to disk at `outpath`.
+
+    With an array of diameters each model block holds one frequency sweep
+    per diameter, and `bubble_diameter_m` gives the diameter of each row.
     """
+    blocks = _ts_blocks(results)
     outpath = Path(outpath)
     outpath.parent.mkdir(parents=True, exist_ok=True)
 
-    freqs = results["params"]["frequencies"]
-    rows = []
-    for model, ts_vals in results["results"]["ts"].items():
-        for i, ts in enumerate(ts_vals):
-            row = {
-                "frequency_kHz": freqs[i],
-                "TS_dB": ts,
-                "model": model,
-                # include bubble diameter
-                "bubble_diameter_m": results["params"].get("bubble_diameter")
-            }
-            # include environment fields if present (dataclass or dict)
-            env = results["params"].get("environment")
-            if env is not None:
-                if hasattr(env, "__dict__"):
-                    row.update(env.__dict__)
-                elif isinstance(env, dict):
-                    row.update(env)
-            rows.append(row)
-
-    df = pd.DataFrame(rows)
+    freqs = np.asarray(results["params"]["frequencies"])
+    n_f = len(freqs)
+
+    # Build each column as one array (model blocks stacked one after another)
+    columns = {
+        "frequency_kHz": np.tile(freqs, len(blocks)),
+        "TS_dB": np.concatenate([ts_vals for _, _, ts_vals in blocks])
+                 if blocks else np.array([], dtype=float),
+        "model": np.repeat([model for model, _, _ in blocks], n_f),
+        # include bubble diameter
+        "bubble_diameter_m": np.repeat([diameter for _, diameter, _ in blocks], n_f),
+    }
+    # include environment fields if present (dataclass or dict)
+    columns.update(_environment_columns(results))
+
+    df = pd.DataFrame(columns)
     df.to_csv(outpath, index=False)
 
 
-def save_figure(fig, outpath: Path) -> None:
+
+def export_results_csv_fast(results: dict, outpath: Path, float_format: str = "%.6g") -> None:
+    """
+    Write the same long-form table as `export_results_csv` without pandas.
+
+    Each model block is %-formatted row by row (as `numpy.savetxt` does)
+    straight into a large write buffer; floats use `float_format` (6
+    significant digits by default).
+    """
+    blocks = _ts_blocks(results)
+    outpath = Path(outpath)
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+
+    freqs = np.asarray(results["params"]["frequencies"], dtype=float).tolist()
+
+    # constant metadata columns, written as literal text on every row
+    env = _environment_columns(results)
+    env_text = "".join("," + ("" if value is None else str(value)) for value in env.values())
+    header = ",".join(["frequency_kHz", "TS_dB", "model", "bubble_diameter_m", *env])
+
+    with open(outpath, "wb", buffering=1 << 20) as fh:
+        fh.write((header + "\n").encode())
+        for model, diameter, ts_vals in blocks:
+            meta_text = f"{model},{diameter}" + env_text
+            # literal text in the row format: a '%' must be escaped as '%%'
+            row_fmt = f"{float_format},{float_format}," + meta_text.replace("%", "%%") + "\n"
+            ts_vals = np.asarray(ts_vals, dtype=float).tolist()
+            fh.write("".join([row_fmt % row for row in zip(freqs, ts_vals)]).encode())
+
+def export_results_csv_stream(results: dict, outpath: Path) -> None:
+    """
+    Stream the same long-form table as `export_results_csv` row by row
+    through `csv.writer`, without building the table in memory first.
+
+    Rows are written one model block at a time, in the same order as
+    `export_results_csv`.
+    """
+    blocks = _ts_blocks(results)
+    outpath = Path(outpath)
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+
+    freqs = np.asarray(results["params"]["frequencies"]).tolist()
+
+    # constant metadata columns, repeated on every row
+    env = _environment_columns(results)
+    env_values = tuple(env.values())
+
+    with open(outpath, "w", newline="", buffering=1 << 20) as fh:
+        writer = csv.writer(fh, lineterminator="\n")  # same line endings as DataFrame.to_csv
+        writer.writerow(["frequency_kHz", "TS_dB", "model", "bubble_diameter_m", *env])
+        for model, diameter, ts_vals in blocks:
+            writer.writerows((freq, ts, model, diameter, *env_values)
+                             for freq, ts in zip(freqs, ts_vals.tolist()))
+
+def export_table(df: pd.DataFrame, outpath: Path, fmt: str = "csv") -> Path:
+    """
+    Write a long-form results DataFrame to `outpath` as CSV or Parquet.
+
+    `fmt="parquet"` needs pyarrow or fastparquet; when neither is installed a
+    warning is issued and the table is written as CSV instead. The suffix of
+    `outpath` is replaced to match the format, and the written path is returned.
+    """
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Unknown output format '{fmt}', expected 'csv' or 'parquet'")
+    outpath = Path(outpath)
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == "parquet":
+        try:
+            parquet_path = outpath.with_suffix(".parquet")
+            df.to_parquet(parquet_path, index=False)
+            return parquet_path
+        except ImportError:
+            warnings.warn("No parquet engine available (install pyarrow); writing CSV instead")
+
+    csv_path = outpath.with_suffix(".csv")
+    df.to_csv(csv_path, index=False)
+    return csv_path
+
+def save_figure(fig, outpath: Path, dpi: int = 150, tight: bool = False) -> None:
     """
     Save a matplotlib figure `fig` to `outpath`, creating directories as needed.
+
+    `dpi` sets the resolution of raster output and of rasterized artists;
+    `tight=True` adds a `bbox_inches="tight"` pass (an extra render), which
+    is unnecessary when the figure already called `tight_layout()`.
     """
     outpath = Path(outpath)
     outpath.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(outpath, dpi=300, bbox_inches="tight")
+    fig.savefig(outpath, dpi=dpi, bbox_inches="tight" if tight else None)
@@ -2,8 +2,7 @@
 import sys
 import os
 import numpy as np
-from concurrent.futures import ProcessPoolExecutor
-from functools import partial  
+from dataclasses import dataclass, fields
 
 # Add parent directory to path to access utils - go up from Bubble/core to root
 current_file = os.path.abspath(__file__)
@@ -15,6 +14,7 @@ root_dir = os.path.dirname(bubble_dir)           # seaEchoTSCalculator
 if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
+from utils import DATACLASS_SLOTS
 from utils.SeaEcho_water import seawater
 from utils.SeaEcho_gas_bubble import air_bubble
 
@@ -30,6 +30,7 @@ from models.modal_solution import calculate_modal_ts
 from models.wildt_medwin_model import calculate_wm_ts
 from models.andreeva_weston_model import calculate_aw_ts
 from models.ainslie_leighton_model import calculate_ainslie_leighton_ts
+from model_specific_utils.wm_utils import compute_resonance_frequency, compute_damping_factors
 
 MODEL_FUNCTIONS = {
     "Medwin_Clay": calculate_medwin_clay_ts,
@@ -41,61 +42,157 @@ MODEL_FUNCTIONS = {
     "Ainslie_Leighton": calculate_ainslie_leighton_ts
 }
 
-def _process_wrapper(f, water_params, bubble_params, c, models):
-    """Reconstruct objects using positional arguments"""
-    # Recreate seawater from tuple (T, z, S)
-    water = seawater(*water_params)
-    
-    # Recreate bubble using (water, T, z, S, d)
-    bubble = air_bubble(water, *bubble_params)
-    
-    return _process_single_frequency(f, water, bubble, c, models)
+# Models that accept the frequency-independent BubbleConstants
+CONSTANTS_MODELS = {"Wildt_Medwin", "Andreeva_Weston", "Ainslie_Leighton"}
+
+@dataclass(frozen=True)
+class BubbleConstants:
+    """Frequency-independent bubble/water quantities shared by several models"""
+    a: float            # bubble radius (m)
+    D_thermal: float    # thermal diffusivity, K_th / (rho_w * cp_w) (m^2/s)
+    omega_0: float      # uncorrected resonance angular frequency (rad/s)
+    beta_viscous: float # viscous damping factor (1/s)
+    beta_thermal: float # thermal damping factor (1/s)
+    beta_0: float       # total damping factor (1/s)
+
+# eq=False: the generated __eq__/__hash__ would compare the ndarray fields
+# element-wise (ambiguous truth value) and hash them (unhashable), so
+# instances compare and hash by identity
+@dataclass(frozen=True, eq=False, **DATACLASS_SLOTS)
+class SweepParams:
+    """Inputs of a frequency sweep for run_calculations"""
+    frequencies: np.ndarray  # sonar frequencies (kHz)
+    d: float                 # bubble diameter (m), or an array of diameters
+    models: tuple            # model names, keys of MODEL_FUNCTIONS
+    T: float                 # temperature (°C)
+    S: float                 # salinity (PSU)
+    z: float                 # depth (m)
 
-def _process_single_frequency(f, water, bubble, c, models):
-    """Core TS calculation logic"""
+    @classmethod
+    def from_mapping(cls, params):
+        """Build from a legacy params dict, ignoring unknown keys"""
+        names = {field.name for field in fields(cls)}
+        kwargs = {key: value for key, value in params.items() if key in names}
+        kwargs['models'] = tuple(kwargs['models'])
+        return cls(**kwargs)
+
+    def __getitem__(self, key):
+        # Mapping-style reads, so consumers of results['params'] keep working
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+def precompute_constants(water, bubble):
+    """Compute BubbleConstants once per water/bubble pair"""
+    a = bubble.d / 2
+    D_thermal = bubble.K_th / (water.rho * water.cp)
+    omega_0 = compute_resonance_frequency(bubble.gamma, water.P, water.rho, a)
+    beta_viscous, beta_thermal, beta_0 = compute_damping_factors(
+        bubble.gamma, water.mu, water.rho, a, D_thermal
+    )
+    return BubbleConstants(a, D_thermal, omega_0, beta_viscous, beta_thermal, beta_0)
+
+def calculate_all_ts(f, c, water, bubble, models):
+    """Evaluate several models over one frequency array, sharing ka and the bubble constants"""
+    f = np.asarray(f)
     k = 2 * np.pi * f * 1000 / c
     a = bubble.d / 2
     ka = k * a
     
+    # Shared invariants are computed once for all models that use them
+    constants = precompute_constants(water, bubble) if CONSTANTS_MODELS.intersection(models) else None
+    
     ts_values = {"ka": ka}
     for model in models:
-        ts_values[model] = MODEL_FUNCTIONS[model](f, c, water, bubble)
+        if model in CONSTANTS_MODELS:
+            ts = MODEL_FUNCTIONS[model](f, c, water, bubble, constants=constants)
+        else:
+            ts = MODEL_FUNCTIONS[model](f, c, water, bubble)
+        ts_values[model] = np.asarray(ts, dtype=float)
     
     return ts_values
 
-def run_calculations(params):
-    """Parallel execution coordinator"""
-    # Initialize objects (unchanged)
-    water = seawater(params['T'], params['z'], params['S'])
-    bubble = air_bubble(water, params['T'], params['z'], params['S'], params['d'])
-    c = water.c
+def _organize_results(values, models):
+    """
+    Pack per-model TS into one (n_models, ...) array, `ts_array`, whose rows
+    also back the `ts` dict, so both access styles share the same memory
+    """
+    models = tuple(models)
+    if models:
+        ts_array = np.stack([values[model] for model in models])
+    else:
+        ts_array = np.empty((0,) + np.shape(values['ka']))
+    return {
+        'ka': values['ka'],
+        'models': models,
+        'ts_array': ts_array,
+        'ts': dict(zip(models, ts_array))
+    }
+
+def run_calculations(params, water=None):
+    """
+    Vectorized execution coordinator; `params` is a SweepParams or an equivalent dict.
+
+    If `d` is an array of diameters, every model is evaluated on one
+    (n_diameters, n_freq) grid and each results['ts'][model] (and 'ka') has
+    that shape; a scalar `d` gives 1-D arrays as before. results['ts_array']
+    stacks the same values along a leading model axis, in `models` order.
+
+    A prebuilt `water` (seawater for the same T, z, S) can be passed to reuse it
+    across sweeps that share an environment.
+    """
+    sweep = params if isinstance(params, SweepParams) else SweepParams.from_mapping(params)
     
-    # Prepare parameters as tuples for positional arguments
-    water_params = (params['T'], params['z'], params['S'])
-    bubble_params = (params['T'], params['z'], params['S'], params['d'])
+    # Diameters run along axis 0 and broadcast against the frequency axis
+    diameters = np.asarray(sweep.d, dtype=float)
+    d = diameters[:, np.newaxis] if diameters.ndim else sweep.d
     
-    # Create partial function
-    processor = partial(
-        _process_wrapper,
-        water_params=water_params,
-        bubble_params=bubble_params,
-        c=c,
-        models=params['models']
-    )
+    # Initialize objects, reusing the caller's seawater when given
+    if water is None:
+        water = seawater(sweep.T, sweep.z, sweep.S)
+    bubble = air_bubble(water, sweep.T, sweep.z, sweep.S, d)
+    c = water.c
     
-    # Execute in parallel
-    with ProcessPoolExecutor() as executor:
-        results = list(executor.map(processor, params['frequencies']))
+    frequencies = np.ascontiguousarray(sweep.frequencies, dtype=float)
+    
+    # Evaluate every model once over the whole frequency (and diameter) grid
+    values = calculate_all_ts(frequencies, c, water, bubble, sweep.models)
     
     # Organize results into dictionary format
-    processed = {
-        'ka': np.array([res['ka'] for res in results]),
-        'ts': {model: np.array([res[model] for res in results]) 
-               for model in params['models']}
-    }
+    processed = _organize_results(values, sweep.models)
     
     return {
         'params': params,
-        'results': processed,  # Now a DICT with 'ka' and 'ts' keys
+        'results': processed,  # DICT with 'ka', 'models', 'ts_array' and per-model 'ts'
         'environment': {'water': water, 'bubble': bubble, 'c': c}
-    }
\ No newline at end of file
+    }
+
+def run_diameter_sweep(params):
+    """Vectorized coordinator for a bubble diameter sweep at a single frequency"""
+    # A one-frequency run over a diameter array: every model broadcasts the
+    # fixed frequency against the radius array
+    sweep = SweepParams(
+        frequencies=np.array([float(params['frequency'])]),
+        d=np.asarray(params['diameters'], dtype=float),
+        models=tuple(params['models']),
+        T=params['T'],
+        S=params['S'],
+        z=params['z'],
+    )
+    output = run_calculations(sweep)
+    
+    # Drop the length-1 frequency axis
+    results = output['results']
+    values = {'ka': results['ka'][:, 0]}
+    values.update((model, ts[:, 0]) for model, ts in results['ts'].items())
+    processed = _organize_results(values, params['models'])
+    
+    return {
+        'params': params,
+        'results': processed,
+        'environment': output['environment']
+    }
@@ -33,6 +33,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -46,7 +47,7 @@ if str(MAIN_ROOT) not in sys.path:
 
 # local helpers
 from core.io_utils import export_results_csv, save_figure 
-from core.processor import run_calculations                 
+from core.processor import SweepParams, run_calculations    
 
 # output directories - use main project plots and data folders
 FIG_DIR = MAIN_ROOT / "plots"
@@ -56,23 +57,26 @@ CSV_DIR.mkdir(parents=True, exist_ok=True)
 
 STAMP = datetime.now().strftime("%Y%m%d_%H%M%S")  # e.g. 20250930_154512
 
+# Frequency sweep, built once at import
+FREQUENCIES = np.logspace(np.log10(1.0), np.log10(1200.0), 2000)  # 1-1200 kHz, 2000 points
+
 # Analysis parameters
-params = {
-    "frequencies": np.logspace(np.log10(1.0), np.log10(1200.0), 2000),  # 1-1200 kHz, 2000 points
-    "d": 2e-3,                     # bubble diameter: 2 mm
-    "models": ["Modal"],           # Modal solution (exact scattering model)
-    "T": 20.0,                     # temperature: 20°C
-    "S": 0.0,                      # salinity: 0 PSU (freshwater)
-    "z": 10.0,                     # depth: 10 m
-}
+params = SweepParams(
+    frequencies=FREQUENCIES,
+    d=2e-3,                        # bubble diameter: 2 mm
+    models=("Modal",),             # Modal solution (exact scattering model)
+    T=20.0,                        # temperature: 20°C
+    S=0.0,                         # salinity: 0 PSU (freshwater)
+    z=10.0,                        # depth: 10 m
+)
 
 def main() -> None:
     """Run bubble target strength analysis and generate plots."""
     print("Calculating bubble target strength...")
-    print(f"Bubble diameter: {params['d']*1000:.1f} mm")
-    print(f"Frequency range: {params['frequencies'][0]:.1f} - {params['frequencies'][-1]:.1f} kHz")
-    print(f"Model: {params['models'][0]}")
-    print(f"Environment: {params['T']}°C, {params['S']} PSU, {params['z']}m depth")
+    print(f"Bubble diameter: {params.d*1000:.1f} mm")
+    print(f"Frequency range: {params.frequencies[0]:.1f} - {params.frequencies[-1]:.1f} kHz")
+    print(f"Model: {params.models[0]}")
+    print(f"Environment: {params.T}°C, {params.S} PSU, {params.z}m depth")
     
     # Run calculations
     results = run_calculations(params)
@@ -81,8 +85,8 @@ def main() -> None:
     fig, ax = plt.subplots(figsize=(6, 4))
     
     # Plot data for each model (though we only have one)
-    for model_name in params["models"]:
-        ax.plot(params["frequencies"], results["results"]["ts"][model_name], 
+    for model_name in params.models:
+        ax.plot(params.frequencies, results["results"]["ts"][model_name], 
                 linewidth=1.5, color='blue')
 
     # Customize plot with larger fonts
@@ -93,7 +97,7 @@ def main() -> None:
     ax.grid(True, which="both", alpha=0.3)
     
     # Add bubble information as text annotation in upper right corner
-    bubble_info = f"Bubble diameter: {params['d']*1000:.1f} mm\nModel: {params['models'][0]}"
+    bubble_info = f"Bubble diameter: {params.d*1000:.1f} mm\nModel: {params.models[0]}"
     ax.text(0.98, 0.98, bubble_info, transform=ax.transAxes, 
             verticalalignment='top', horizontalalignment='right', fontsize=12)
     
@@ -106,8 +110,12 @@ def main() -> None:
     csv_path = CSV_DIR / "2mm_bubble_frequency_sweep.csv"
     fig_path = FIG_DIR / "2mm_bubble_frequency_sweep.pdf"
     
-    export_results_csv(results, csv_path)
-    save_figure(fig, fig_path)
+    # CSV and figure go to independent files, so write them concurrently
+    with ThreadPoolExecutor(2) as executor:
+        csv_job = executor.submit(export_results_csv, results, csv_path)
+        fig_job = executor.submit(save_figure, fig, fig_path)
+        csv_job.result()
+        fig_job.result()
 
     print(f"\nResults saved:")
     print(f"CSV  → {csv_path.relative_to(MAIN_ROOT)}")
@@ -30,7 +30,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 PROJECT_ROOT = Path(__file__).resolve().parents[1]  # …/Bubble
@@ -42,7 +42,7 @@ if str(MAIN_ROOT) not in sys.path:
 
 # local helpers
 from core.io_utils import export_results_csv, save_figure  # noqa: E402
-from core.processor import run_calculations                 # noqa: E402
+from core.processor import SweepParams, run_calculations    # noqa: E402
 
 # output directories - use main project plots and data folders
 FIG_DIR = MAIN_ROOT / "plots"
@@ -50,22 +50,24 @@ CSV_DIR = MAIN_ROOT / "data"
 FIG_DIR.mkdir(parents=True, exist_ok=True)
 CSV_DIR.mkdir(parents=True, exist_ok=True)
 
+# Frequency sweep configuration (logarithmic scale), built once at import
+FREQUENCIES = np.logspace(np.log10(1.0), np.log10(1000.0), 3000)  # 1-1000 kHz, 3000 points
+
 # User-configurable parameters for bubble scattering analysis
-params = {
-    # Frequency sweep configuration (logarithmic scale)
-    "frequencies": np.logspace(np.log10(1.0), np.log10(1000.0), 3000),  # 1-1000 kHz, 3000 points
+params = SweepParams(
+    frequencies=FREQUENCIES,
     
     # Bubble characteristics
-    "d": 2e-3,  # Bubble diameter in meters (2mm)
+    d=2e-3,  # Bubble diameter in meters (2mm)
     
     # Models to compare (all 7 available models)
-    "models": ["Medwin_Clay", "Breathing", "Thuraisingham", "Modal", "Wildt_Medwin", "Andreeva_Weston", "Ainslie_Leighton"],
+    models=("Medwin_Clay", "Breathing", "Thuraisingham", "Modal", "Wildt_Medwin", "Andreeva_Weston", "Ainslie_Leighton"),
     
     # Seawater environmental parameters
-    "T": 20.0,  # Temperature in Celsius
-    "S": 0.0,   # Salinity in PSU (0 = fresh water)
-    "z": 10.0,  # Depth in meters
-}
+    T=20.0,  # Temperature in Celsius
+    S=0.0,   # Salinity in PSU (0 = fresh water)
+    z=10.0,  # Depth in meters
+)
 
 # main function to run calculations and plot results
 def main() -> None:
@@ -74,9 +76,8 @@ def main() -> None:
 
     # plot each model on same axes with compact figure size
     fig, ax = plt.subplots(figsize=(6.2, 4))
-    for model in params["models"]:
-        ts = results["results"]["ts"][model]
-        ax.plot(params["frequencies"], ts, label=model)
+    for model, ts in zip(params.models, results["results"]["ts_array"]):
+        ax.plot(params.frequencies, ts, label=model)
 
     ax.set_xlabel("Frequency (kHz)", fontsize=13)
     ax.set_ylabel("Target Strength (dB)", fontsize=13)
@@ -90,8 +91,12 @@ def main() -> None:
     # Save results with descriptive filenames
     csv_path = CSV_DIR / "compare_models_results.csv"
     fig_path = FIG_DIR / "compare_models.pdf"
-    export_results_csv(results, csv_path)
-    save_figure(fig, fig_path)
+    # CSV and figure go to independent files, so write them concurrently
+    with ThreadPoolExecutor(2) as executor:
+        csv_job = executor.submit(export_results_csv, results, csv_path)
+        fig_job = executor.submit(save_figure, fig, fig_path)
+        csv_job.result()
+        fig_job.result()
 
     # Display output paths relative to project root
     print(f"Results saved:")
@@ -28,8 +28,7 @@ import matplotlib.pyplot as plt
 # Add the parent directories to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.io_utils import save_figure
-from core.processor import run_calculations
+from core.processor import run_diameter_sweep
 
 # Analysis parameters
 frequency = 18.0  # kHz - appropriate for larger bubbles (0.2-10 mm)
@@ -52,32 +51,19 @@ def main() -> None:
     print(f"Model: {models[0]}")
     print(f"Environment: {T}°C, {S} PSU, {z}m depth")
     
-    # Calculate target strength for each diameter
-    target_strengths = []
-    
-    for i, diameter_mm in enumerate(diameters_mm):
-        # Parameters for this diameter using the same format as other examples
-        params = {
-            "frequencies": np.array([frequency_khz]),
-            "d": diameter_mm * 1e-3,  # Convert mm to m  
-            "models": models,
-            "T": T,
-            "S": S,
-            "z": z,
-        }
-        
-        # Run calculation for this diameter
-        results = run_calculations(params)
-        
-        # Extract target strength for this diameter
-        ts_value = results["results"]["ts"][models[0]][0]  # First (and only) frequency
-        target_strengths.append(ts_value)
-        
-        if (i + 1) % 10 == 0:  # Progress indicator (every 10 calculations)
-            print(f"  Completed {i + 1}/{len(diameters_mm)} calculations...")
-    
-    # Convert to arrays for plotting
-    target_strengths = np.array(target_strengths)
+    # Calculate target strength for all diameters in one vectorized call
+    params = {
+        "frequency": frequency_khz,
+        "diameters": diameters_mm * 1e-3,  # Convert mm to m
+        "models": models,
+        "T": T,
+        "S": S,
+        "z": z,
+    }
+    results = run_diameter_sweep(params)
+    
+    # Extract target strength for every diameter
+    target_strengths = results["results"]["ts"][models[0]]
     
     # Summary statistics
     print(f"\nCalculation Summary:")
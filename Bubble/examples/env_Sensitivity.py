@@ -29,7 +29,6 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from datetime import datetime
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -43,8 +42,8 @@ if str(MAIN_ROOT) not in sys.path:
     sys.path.insert(0, str(MAIN_ROOT))
 
 # Local helpers and core functionality
-from core.io_utils import save_figure                 # noqa: E402
-from core.processor import run_calculations           # noqa: E402
+from core.io_utils import export_table, save_figure   # noqa: E402
+from core.processor import SweepParams, run_calculations  # noqa: E402
 
 # Output directories - use main project plots and data folders
 FIG_DIR = MAIN_ROOT / "plots"
@@ -62,6 +61,9 @@ params_config = {
     
     # Bubble characteristics
     "bubble_diameter": 2e-3,  # Bubble diameter in meters (2mm)
+    
+    # Table output format: "csv" or "parquet" (parquet needs pyarrow)
+    "output_format": "csv",
 }
 
 # Environmental parameter variations to test
@@ -73,20 +75,37 @@ environments = [
     {"T": 5.0,  "S": 35.0, "z": 100.0},  # Cold deep water
 ]
 
+# Figure/axes reused by repeated main() calls (e.g. batched test runs);
+# created on first use and recreated if its window has been closed
+_FIG = None
+_AX = None
+
+def _get_axes():
+    """Return the shared figure and axes, cleared for a new plot."""
+    global _FIG, _AX
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG, _AX = plt.subplots(figsize=(6, 4))
+    else:
+        _AX.clear()
+    return _FIG, _AX
+
 # Main function to run environmental sensitivity analysis
 def main() -> None:
     # Create plot with improved styling
-    fig, ax = plt.subplots(figsize=(6, 4))
-    rows: list[dict] = []
+    fig, ax = _get_axes()
+    # TS column for CSV export, filled in place one block per (environment, model)
+    n_freqs = len(params_config["frequencies"])
+    ts_col = np.empty(len(environments) * len(params_config["models"]) * n_freqs)
+    block = 0
 
     for env in environments:
         # Build parameters for this environmental condition
-        params = {
-            "frequencies": params_config["frequencies"],
-            "d": params_config["bubble_diameter"],
-            "models": params_config["models"],
+        params = SweepParams(
+            frequencies=params_config["frequencies"],
+            d=params_config["bubble_diameter"],
+            models=tuple(params_config["models"]),
             **env,  # Add T, S, z from environment dict
-        }
+        )
         
         # Run calculation for this environment
         results = run_calculations(params)
@@ -99,16 +118,8 @@ def main() -> None:
 
         # Collect data for CSV export
         for model in params_config["models"]:
-            for i, ts in enumerate(results["results"]["ts"][model]):
-                rows.append({
-                    "frequency_kHz": params_config["frequencies"][i],
-                    "TS_dB": ts,
-                    "model": model,
-                    "bubble_diameter_m": params_config["bubble_diameter"],
-                    "temperature_C": env['T'],
-                    "salinity_PSU": env['S'],
-                    "depth_m": env['z'],
-                })
+            ts_col[block * n_freqs:(block + 1) * n_freqs] = results["results"]["ts"][model]
+            block += 1
 
     # Configure plot with improved styling (consistent with other scripts)
     ax.set_xscale("log")
@@ -127,16 +138,28 @@ def main() -> None:
     # Save figure
     save_figure(fig, fig_path)
     
-    # Save detailed CSV with all environmental parameters
-    df = pd.DataFrame(rows)
-    df.to_csv(csv_path, index=False)
+    # Save detailed CSV with all environmental parameters, built column-wise
+    # (blocks are ordered environment -> model -> frequency)
+    freqs = params_config["frequencies"]
+    n_models = len(params_config["models"])
+    block_len = n_models * len(freqs)
+    df = pd.DataFrame({
+        "frequency_kHz": np.tile(freqs, block),
+        "TS_dB": ts_col,
+        "model": np.tile(np.repeat(params_config["models"], len(freqs)), len(environments)),
+        "bubble_diameter_m": params_config["bubble_diameter"],
+        "temperature_C": np.repeat([env['T'] for env in environments], block_len),
+        "salinity_PSU": np.repeat([env['S'] for env in environments], block_len),
+        "depth_m": np.repeat([env['z'] for env in environments], block_len),
+    })
+    csv_path = export_table(df, csv_path, fmt=params_config["output_format"])
 
     # Display output paths relative to project root
     print(f"Results saved:")
     print(f"CSV → {csv_path.relative_to(MAIN_ROOT)}")
     print(f"PNG → {fig_path.relative_to(MAIN_ROOT)}")
     
-    # Show the plot
+    # Show the plot; the figure is kept for reuse by the next run
     plt.show()
 
 if __name__ == "__main__":
@@ -32,7 +32,6 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from datetime import datetime
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -46,8 +45,9 @@ if str(MAIN_ROOT) not in sys.path:
     sys.path.insert(0, str(MAIN_ROOT))
 
 # local helpers
-from core.io_utils import save_figure  # noqa: E402
-from core.processor import run_calculations   # noqa: E402
+from core.io_utils import export_table, save_figure  # noqa: E402
+from core.processor import SweepParams, run_calculations  # noqa: E402
+from utils.SeaEcho_water import seawater                  # noqa: E402
 
 # output directories - use main project plots and data folders
 FIG_DIR = MAIN_ROOT / "plots"
@@ -65,6 +65,23 @@ z = 50.0        # depth: 50 m
 # Bubble diameters to analyze (metres)
 diameters = np.array([0.5e-3, 1e-3, 2e-3, 5e-3])  # 0.5, 1.0, 2.0, 5.0 mm
 
+# Table output format: "csv" or "parquet" (parquet needs pyarrow)
+output_format = "csv"
+
+# Figure/axes reused by repeated main() calls (e.g. batched test runs);
+# created on first use and recreated if its window has been closed
+_FIG = None
+_AX = None
+
+def _get_axes():
+    """Return the shared figure and axes, cleared for a new plot."""
+    global _FIG, _AX
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG, _AX = plt.subplots(figsize=(6, 4))
+    else:
+        _AX.clear()
+    return _FIG, _AX
+
 def main() -> None:
     """Run bubble diameter sweep analysis and generate plots."""
     print("Calculating target strength for multiple bubble sizes...")
@@ -74,39 +91,28 @@ def main() -> None:
     print(f"Environment: {T}°C, {S} PSU, {z}m depth")
 
     # Prepare improved plot
-    fig, ax = plt.subplots(figsize=(6,4))
-    # Collect rows for combined CSV
-    rows: list[dict] = []
-
-    for d in diameters:
-        params = {
-            "frequencies": frequencies,
-            "d": float(d),
-            "models": models,
-            "T": T,
-            "S": S,
-            "z": z,
-        }
-        # Run calculation for this diameter
-        results = run_calculations(params)
-
-        # Plot TS vs frequency for this diameter
-        ts_vals = results["results"]["ts"][models[0]]
+    fig, ax = _get_axes()
+
+    # Environment is shared by every diameter, so build the seawater once
+    water = seawater(T, z, S)
+
+    # One call evaluates all diameters on a (n_diameters, n_freq) grid
+    params = SweepParams(
+        frequencies=frequencies,
+        d=diameters,
+        models=tuple(models),
+        T=T,
+        S=S,
+        z=z,
+    )
+    results = run_calculations(params, water=water)
+    # (n_models, n_diameters, n_freq) array, models in params order
+    ts_array = results["results"]["ts_array"]
+
+    # Plot TS vs frequency, one row per diameter
+    for d, ts_vals in zip(diameters, ts_array[0]):
         ax.plot(frequencies, ts_vals, label=f"d={d*1e3:.1f} mm")
 
-        # Flatten results into rows
-        for model in models:
-            for i, ts in enumerate(results["results"]["ts"][model]):
-                rows.append({
-                    "frequency_kHz": frequencies[i],
-                    "TS_dB": ts,
-                    "model": model,
-                    "bubble_diameter_m": d,
-                    "temperature_C": T,
-                    "salinity_PSU": S,
-                    "depth_m": z,
-                })
-
     # Customize plot with larger fonts and clean styling
     ax.set_xscale("log")
     ax.set_xlabel("Frequency (kHz)", fontsize=14)
@@ -129,10 +135,19 @@ def main() -> None:
     fig_path = FIG_DIR / "multi_bubble_frequency_sweep.pdf"
     save_figure(fig, fig_path)
 
-    # Save combined CSV with descriptive name
-    df = pd.DataFrame(rows)
-    csv_path = CSV_DIR / "multi_bubble_frequency_sweep.csv"
-    df.to_csv(csv_path, index=False)
+    # Save combined CSV with descriptive name, built column-wise
+    # (rows are ordered diameter -> model -> frequency)
+    ts_grid = np.moveaxis(ts_array, 0, 1)
+    df = pd.DataFrame({
+        "frequency_kHz": np.tile(frequencies, len(diameters) * len(models)),
+        "TS_dB": ts_grid.ravel(),
+        "model": np.tile(np.repeat(models, len(frequencies)), len(diameters)),
+        "bubble_diameter_m": np.repeat(diameters, len(models) * len(frequencies)),
+        "temperature_C": T,
+        "salinity_PSU": S,
+        "depth_m": z,
+    })
+    csv_path = export_table(df, CSV_DIR / "multi_bubble_frequency_sweep.csv", fmt=output_format)
 
     print(f"\nResults saved:")
     print(f"PNG → {fig_path.relative_to(MAIN_ROOT)}")
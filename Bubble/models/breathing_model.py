@@ -6,7 +6,7 @@ def calculate_breathing_ts(f, c, water, bubble):
 
     Parameters:
     -----------
-    f : float
+    f : float or numpy.ndarray
         Sonar frequency (kHz).
     c : float
         Sound speed in seawater (m/s).
@@ -18,7 +18,7 @@ def calculate_breathing_ts(f, c, water, bubble):
 
     Returns:
     --------
-    float
+    float or numpy.ndarray
         Target Strength (TS) in decibels (dB).
 
     Variables:
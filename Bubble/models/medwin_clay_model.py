@@ -12,7 +12,7 @@ def calculate_medwin_clay_ts(f, c, water, bubble):
 
     Parameters:
     -----------
-    f : float
+    f : float or numpy.ndarray
         Sonar frequency (kHz).
     c : float
         Sound speed in seawater (m/s).
@@ -24,7 +24,7 @@ def calculate_medwin_clay_ts(f, c, water, bubble):
 
     Returns:
     --------
-    float
+    float or numpy.ndarray
         Target Strength (TS) in decibels (dB).
 
     Variables:
@@ -33,39 +33,39 @@ def calculate_medwin_clay_ts(f, c, water, bubble):
         Bubble radius (m), derived from diameter.
     f_b : float
         Resonance frequency without corrections (Hz).
-    f_R : float
+    f_R : float or numpy.ndarray
         Resonance frequency with corrections (Hz).
     correction_params : array-like
         Correction parameters [b, d/b, beta].
-    delta : float
+    delta : float or numpy.ndarray
         Damping constant, including scattering, thermal, and viscous components.
-    sigma_bs : float
+    sigma_bs : float or numpy.ndarray
         Backscattering cross-section (m^2).
-    TS : float
+    TS : float or numpy.ndarray
         Target Strength (dB), derived from sigma_bs.
     """
     a = bubble.d / 2  # Bubble radius (m)
 
-    # Compute resonance frequency and damping constant using existing functions
-    f_b, f_R, correction_params = resonance_freq(f, c, water, bubble)
-    delta = damping_constant(f, c, water, bubble)
-    
-    # Smart frequency selection: use f_R if valid, fallback to f_b if f_R is NaN
-    if np.isnan(f_R):
-        # Fallback to uncorrected frequency when corrections fail
-        freq_to_use = f_b
-        # Also use simplified damping when thermal corrections fail
-        omega = 2 * np.pi * f * 1000  # radians/sec  
+    # NaN corrections are replaced below, so their invalid/divide warnings are noise
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Compute resonance frequency and damping constant using existing functions
+        resonance = resonance_freq(f, c, water, bubble)
+        f_b, f_R, correction_params = resonance
+        delta = damping_constant(f, c, water, bubble, precomputed=resonance)
+
+        # Simplified damping when thermal corrections fail
+        omega = 2 * np.pi * f * 1000  # radians/sec
         delta_r = omega * a / c  # Re-radiation damping
         delta_nu = 4 * water.mu / (water.rho * omega * a**2)  # Viscous damping
-        delta_fallback = delta_r + delta_nu  # Simplified damping
-        delta_to_use = delta_fallback if np.isnan(delta) else delta
-    else:
-        # Use corrected frequency when available
-        freq_to_use = f_R
-        delta_to_use = delta
-    
-    # Target Strength using selected frequency and damping
-    TS = 10 * np.log10(a**2 / ((freq_to_use/(f*1e3)-1)**2 + delta_to_use**2))
+        delta_fallback = delta_r + delta_nu
+
+        # Smart frequency selection: use f_R if valid, fallback to f_b if f_R is NaN
+        # (both candidates are computed and selected element-wise, without branching)
+        failed = np.isnan(f_R)
+        freq_to_use = np.where(failed, f_b, f_R)
+        delta_to_use = np.where(failed & np.isnan(delta), delta_fallback, delta)
+
+        # Target Strength using selected frequency and damping
+        TS = 10 * np.log10(a**2 / ((freq_to_use/(f*1e3)-1)**2 + delta_to_use**2))
     return TS
 
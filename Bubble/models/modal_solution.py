@@ -1,16 +1,8 @@
-import sys
-import os
+import numpy as np
+from scipy.special import spherical_jn, spherical_yn
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from mpmath import nsum, besselj, hankel1, diff, log10, sqrt, pi
-from model_specific_utils.math_utils import (
-    spherical_bessel_j,
-    spherical_bessel_j_derivative,
-    spherical_hankel1,
-    spherical_hankel1_derivative,
-)
+# Number of partial waves summed in the modal series
+MAX_N = 50
 
 def calculate_modal_ts(f, c, water, bubble):
     """
@@ -18,7 +10,7 @@ def calculate_modal_ts(f, c, water, bubble):
 
     Parameters:
     -----------
-    f : float
+    f : float or numpy.ndarray
         Sonar frequency (kHz).
     c : float
         Sound speed in seawater (m/s).
@@ -30,7 +22,7 @@ def calculate_modal_ts(f, c, water, bubble):
 
     Returns:
     --------
-    float
+    float or numpy.ndarray
         Target Strength (TS) in decibels (dB).
 
     Variables:
@@ -51,10 +43,12 @@ def calculate_modal_ts(f, c, water, bubble):
         Density ratio of gas to water.
     kg : float
         Wave number in gas (1/m).
-    ka : float
+    ka : float or numpy.ndarray
         Dimensionless wave number in water.
-    kga : float
+    kga : float or numpy.ndarray
         Dimensionless wave number in gas.
+    n : numpy.ndarray
+        Series indices 0..MAX_N-1, broadcast along a trailing axis.
     L : complex
         Modal scattering amplitude.
     sigma : float
@@ -63,19 +57,13 @@ def calculate_modal_ts(f, c, water, bubble):
         Target Strength (dB), derived from sigma.
     """
     # Bubble radius (m)
-    a = bubble.d / 2
-
-    # Angular frequency in radians/sec
-    omega = 2 * pi * f * 1000
-
-    # Wave number in water
-    k = omega / c
+    a = np.asarray(bubble.d) / 2
 
     # Gas constant, J/(mol·K)
     R = 8.31446261815324
 
     # Sound speed in the bubble gas (m/s)
-    cg = sqrt(bubble.gamma * R * (water.T + 273.15) / bubble.Mm)
+    cg = np.sqrt(bubble.gamma * R * (water.T + 273.15) / bubble.Mm)
 
     # Sound speed ratio (gas to water)
     hc = cg / c
@@ -83,49 +71,42 @@ def calculate_modal_ts(f, c, water, bubble):
     # Density ratio (gas to water)
     gp = bubble.rho / water.rho
 
-    # Wave number in gas
-    kg = omega / cg
-
-    # Dimensionless wave numbers
-    ka = k * a
-    kga = kg * a
-
-    def series_term(n, ka, kga):
-        """
-        Compute a single term in the infinite series for modal solution.
-
-        Parameters:
-        -----------
-        n : int
-            Series index.
-        ka : float
-            Dimensionless wave number in water.
-        kga : float
-            Dimensionless wave number in gas.
-
-        Returns:
-        --------
-        complex
-            Contribution of the nth term to the modal scattering amplitude.
-        """
-        numerator = (
-            spherical_bessel_j_derivative(n, kga) * spherical_bessel_j(n, ka)
-            - gp * hc * spherical_bessel_j(n, kga) * spherical_bessel_j_derivative(n, ka)
-        )
-        denominator = (
-            spherical_bessel_j_derivative(n, kga) * spherical_hankel1(n, ka)
-            - gp * hc * spherical_bessel_j(n, kga) * spherical_hankel1_derivative(n, ka)
-        )
-        return (-1)**n * (2 * n + 1) * (numerator / denominator)
+    # Angular frequency in radians/sec; kept in float64, since scipy's Bessel
+    # functions are double precision and the sharp high-order modal nulls are
+    # sensitive to rounding of ka
+    omega = 2 * np.pi * np.asarray(f, dtype=float) * 1000
+
+    # Dimensionless wave numbers in water and gas, with a trailing axis for n
+    ka = (omega / c * a)[..., np.newaxis]
+    kga = (omega / cg * a)[..., np.newaxis]
+    n = np.arange(MAX_N)
+
+    # Gas/water impedance ratio; bubble density can vary with diameter
+    gphc = np.asarray(gp * hc)[..., np.newaxis]
+
+    # Every special function is evaluated once over the (..., n) grid
+    j_kga = spherical_jn(n, kga)
+    jd_kga = spherical_jn(n, kga, derivative=True)
+    j_ka = spherical_jn(n, ka)
+    jd_ka = spherical_jn(n, ka, derivative=True)
+    h_ka = j_ka + 1j * spherical_yn(n, ka)
+    hd_ka = jd_ka + 1j * spherical_yn(n, ka, derivative=True)
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        numerator = jd_kga * j_ka - gphc * j_kga * jd_ka
+        denominator = jd_kga * h_ka - gphc * j_kga * hd_ka
+        terms = (-1.0)**n * (2 * n + 1) * (numerator / denominator)
+
+    # High orders at small ka overflow y_n to inf; those terms are negligible
+    terms = np.where(np.isfinite(terms), terms, 0)
 
     # Summing the series with a cutoff for convergence
-    max_n = 50  # Adjustable upper limit for series convergence
-    L = 1j * a / ka * sum(series_term(n, ka, kga) for n in range(max_n))
+    L = 1j * a / ka[..., 0] * terms.sum(axis=-1)
 
     # Compute backscattering cross-section (sigma)
-    sigma = abs(L)**2
+    sigma = np.abs(L)**2
 
     # Target Strength (TS) in decibels
-    TS = 10 * log10(sigma)
+    TS = 10 * np.log10(sigma)
 
     return TS
@@ -8,13 +8,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from model_specific_utils.wm_utils import compute_resonance_frequency,compute_damping_factors,compute_dimensionless_correction, compute_scattering_cross_section_WM
 
-def calculate_wm_ts(f, c, water, bubble):
+def calculate_wm_ts(f, c, water, bubble, constants=None):
     """
     Compute Target Strength (TS) using the Wildt-Medwin model.
 
     Parameters:
     -----------
-    f : float
+    f : float or numpy.ndarray
         Frequency in kHz.
     c : float
         Speed of sound in seawater (m/s).
@@ -22,22 +22,28 @@ def calculate_wm_ts(f, c, water, bubble):
         Seawater properties.
     bubble : object
         Bubble properties.
+    constants : BubbleConstants, optional
+        Frequency-independent quantities from `core.processor.precompute_constants`;
+        derived from `water` and `bubble` when omitted.
 
     Returns:
     --------
-    float
+    float or numpy.ndarray
         Computed TS value in dB.
     """
     omega = 2 * np.pi * f * 1000  # Convert kHz to rad/s
-    R_0 = bubble.d / 2  # Bubble radius
-
-    # Compute resonance frequency
-    omega_0 = compute_resonance_frequency(bubble.gamma, water.P, water.rho, R_0)
-
-    # Compute damping factors
-    beta_viscous, beta_thermal, beta_0 = compute_damping_factors(
-        bubble.gamma, water.mu, water.rho, R_0, bubble.K_th / (water.rho * water.cp)
-    )
+    if constants is None:
+        R_0 = bubble.d / 2  # Bubble radius
+
+        # Compute resonance frequency
+        omega_0 = compute_resonance_frequency(bubble.gamma, water.P, water.rho, R_0)
+
+        # Compute damping factors
+        beta_viscous, beta_thermal, beta_0 = compute_damping_factors(
+            bubble.gamma, water.mu, water.rho, R_0, bubble.K_th / (water.rho * water.cp)
+        )
+    else:
+        R_0, omega_0, beta_0 = constants.a, constants.omega_0, constants.beta_0
 
     # Compute dimensionless correction
     epsilon = compute_dimensionless_correction(omega, R_0, c)
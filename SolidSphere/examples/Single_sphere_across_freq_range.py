@@ -13,7 +13,6 @@ The script calculates TS values for a sphere with user-defined parameters includ
 Results are plotted and saved as a PNG file showing TS vs frequency response.
 """
 
-from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import sys
 from pathlib import Path
@@ -26,7 +25,7 @@ if str(PROJECT_ROOT) not in sys.path:
 if str(MAIN_ROOT) not in sys.path:
     sys.path.insert(0, str(MAIN_ROOT))
 
-from utils.SeaEcho_water import seawater
+from utils.SeaEcho_water import get_seawater
 from utils.SeaEcho_solid_sphere import Tungsten_carbide
 from models.SeaEcho_TS_SolidSphere import TS_solid_sphere
 from core.io_utils import plot_ts_vs_frequency
@@ -47,7 +46,7 @@ def main():
     """
 
     # Create seawater and material objects
-    water = seawater(T, z, S)
+    water = get_seawater(T, z, S)
     WC = Tungsten_carbide()
     
     # Report water sound speed
@@ -58,15 +57,8 @@ def main():
     print(f"  Sound speed in water: {water.c:.2f} m/s")
     print(f"  Water density: {water.rho:.2f} kg/m³")
 
-    # Use ProcessPoolExecutor to parallelize frequency computations
-    with ProcessPoolExecutor() as executor:
-        TS = list(executor.map(TS_solid_sphere, sonar_frequencies,
-                                        [radius] * len(sonar_frequencies),
-                                        [WC] * len(sonar_frequencies),
-                                        [water] * len(sonar_frequencies)))
-
-    # Convert results to numpy array and regular floats
-    TS = np.array([float(ts) for ts in TS])
+    # Evaluate the whole frequency array in one call
+    TS = TS_solid_sphere(sonar_frequencies, radius, WC, water)
 
     """
     User can uncomment below print statements as needed
@@ -13,7 +13,6 @@ The script calculates TS values for both materials with user-defined parameters
 Results are plotted and saved as a PNG file showing TS vs frequency response for comparison.
 """
 
-from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import sys
 from pathlib import Path
@@ -26,7 +25,7 @@ if str(PROJECT_ROOT) not in sys.path:
 if str(MAIN_ROOT) not in sys.path:
     sys.path.insert(0, str(MAIN_ROOT))
 
-from utils.SeaEcho_water import seawater
+from utils.SeaEcho_water import get_seawater
 from utils.SeaEcho_solid_sphere import Tungsten_carbide, Copper
 from models.SeaEcho_TS_SolidSphere import TS_solid_sphere
 from core.io_utils import plot_ts_vs_frequency
@@ -47,27 +46,16 @@ def main():
     """
 
     # Create seawater and material objects
-    water = seawater(T, z, S)
+    water = get_seawater(T, z, S)
     WC = Tungsten_carbide()
     copper = Copper()
 
-    # Use ProcessPoolExecutor to parallelize frequency computations for both materials
-    with ProcessPoolExecutor() as executor:
-        # Calculate TS for Tungsten Carbide
-        TS_WC = list(executor.map(TS_solid_sphere, sonar_frequencies,
-                                        [radius] * len(sonar_frequencies),
-                                        [WC] * len(sonar_frequencies),
-                                        [water] * len(sonar_frequencies)))
-        
-        # Calculate TS for Copper
-        TS_copper = list(executor.map(TS_solid_sphere, sonar_frequencies,
-                                        [radius] * len(sonar_frequencies),
-                                        [copper] * len(sonar_frequencies),
-                                        [water] * len(sonar_frequencies)))
-
-    # Convert results to numpy arrays and regular floats
-    TS_WC = np.array([float(ts) for ts in TS_WC])
-    TS_copper = np.array([float(ts) for ts in TS_copper])
+    # Evaluate the whole frequency array in one call per material
+    # Calculate TS for Tungsten Carbide
+    TS_WC = TS_solid_sphere(sonar_frequencies, radius, WC, water)
+    
+    # Calculate TS for Copper
+    TS_copper = TS_solid_sphere(sonar_frequencies, radius, copper, water)
 
     """
     User can uncomment below print statements as needed
@@ -13,7 +13,6 @@ The script calculates TS values for spheres with user-defined parameters includi
 Results are plotted and saved as a PNG file showing TS vs sphere radius response.
 """
 
-from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import sys
 from pathlib import Path
@@ -26,7 +25,7 @@ if str(PROJECT_ROOT) not in sys.path:
 if str(MAIN_ROOT) not in sys.path:
     sys.path.insert(0, str(MAIN_ROOT))
 
-from utils.SeaEcho_water import seawater
+from utils.SeaEcho_water import get_seawater
 from utils.SeaEcho_solid_sphere import Tungsten_carbide
 from models.SeaEcho_TS_SolidSphere import TS_solid_sphere
 from core.io_utils import plot_ts_vs_radius
@@ -47,19 +46,11 @@ def main():
     """
 
     # Create seawater and material objects
-    water = seawater(T, z, S)
+    water = get_seawater(T, z, S)
     WC = Tungsten_carbide()
 
-    # Use ProcessPoolExecutor to parallelize radius computations
-    with ProcessPoolExecutor() as executor:
-        TS = list(executor.map(TS_solid_sphere, 
-                                        [sonar_frequency] * len(radii),
-                                        radii,
-                                        [WC] * len(radii),
-                                        [water] * len(radii)))
-
-    # Convert results to numpy array and regular floats
-    TS = np.array([float(ts) for ts in TS])
+    # Evaluate the whole radius array in one call
+    TS = TS_solid_sphere(sonar_frequency, radii, WC, water)
 
     """
     User can uncomment below print statements as needed
@@ -1,5 +1,49 @@
-import mpmath
+import warnings
 import numpy as np
+from scipy.special import spherical_jn, spherical_yn
+
+def _n_max(ka):
+    """
+    Number of partial waves needed for convergence at `ka` (Wiscombe-style
+    ka + 4 ka^(1/3) criterion, with a safety margin).
+    """
+    return np.ceil(ka + 4 * np.cbrt(ka) + 10).astype(int)
+
+def _j_ratios(n_top, z):
+    """
+    Ratios R_m = j_(m+1)(z) / j_m(z) of spherical Bessel functions of the
+    first kind for orders m = -1 .. n_top + 1, along the trailing axis of `z`
+    (length 1), by Miller's downward recurrence. Unlike j_n itself, these
+    stay finite where j_n(z) underflows (n >> z); R_-1 follows
+    j_-1 = cos(z)/z, which obeys the same recurrence.
+    """
+    z = z[..., 0]
+    # Start well above both the highest order and z, where R_m ~ z/(2m+3)
+    m_start = n_top + 22 + int(np.ceil(np.nanmax(z, initial=0)))
+    ratios = np.empty(z.shape + (n_top + 3,))
+    r = z / (2 * m_start + 3)
+    for m in range(m_start, -1, -1):
+        # j_(m-1) / j_m = (2m+1)/z - R_m
+        r = 1 / ((2 * m + 1) / z - r)
+        if m <= n_top + 2:
+            ratios[..., m] = r
+    return ratios
+
+def _scaled_derivatives(n, z, ratios):
+    """
+    First derivative j_n'(z) / j_n(z), and the second derivative in the form
+    used by the original series divided by j_n(z) (the j_(n+2) term enters
+    without the z**2 factor of the textbook identity), from `ratios` of
+    _j_ratios.
+    """
+    top = len(n)
+    r_m1, r_0, r_p1 = (ratios[..., i:i + top] for i in range(3))
+    s_0 = (2 * n + 1) / z - r_0   # j_(n-1) / j_n
+    s_m1 = (2 * n - 1) / z - r_m1 # j_(n-2) / j_(n-1)
+    jd = n / z - r_0
+    jdd = (z**2 * s_m1 * s_0 - 2 * z**2 + r_0 * r_p1
+           - 2 * z * s_0 + 2 * z * r_0 + 3) / (4 * z**2)
+    return jd, jdd
 
 def TS_solid_sphere(f, a, sphere_material, water):
     """
@@ -7,82 +51,112 @@ def TS_solid_sphere(f, a, sphere_material, water):
 
     Parameters:
     ----------
-    f : float
+    f : float or numpy.ndarray
         Sonar frequency (kHz).
-    a : float
-        Sphere radius (m).
-    sphere_material : object
-        Material properties of the sphere.
+    a : float or numpy.ndarray
+        Sphere radius (m); broadcast against `f`.
+    sphere_material : object or tuple
+        Material properties of the sphere (rho, c_lon, c_trans attributes),
+        or a (rho, c_lon, c_trans) tuple; array properties broadcast
+        against `f` and `a`.
     water : object
         Properties of the surrounding water.
-    
+
     Returns:
     --------
-    TS : float
-        Target Strength (dB).
+    TS : float or numpy.ndarray
+        Target Strength (dB), with the broadcast shape of `f`, `a` and the
+        material properties.
     """
+    if isinstance(sphere_material, tuple):
+        rho, c_lon, c_trans = sphere_material
+    else:
+        rho, c_lon, c_trans = sphere_material.rho, sphere_material.c_lon, sphere_material.c_trans
+    f, a, rho, c_lon, c_trans = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (f, a, rho, c_lon, c_trans))
+    )
+
+    # Material density/sound-speed ratios do not depend on frequency or radius
+    # (kept with a trailing axis for the series orders)
+    alpha = (2 * (rho / water.rho) * (c_trans / water.c)**2)[..., np.newaxis]
+    beta = (2 * (rho / water.rho) * (c_lon / water.c)**2)[..., np.newaxis] - alpha
+
     omega = 2 * np.pi * f * 1000  # Radians/sec
     k = omega / water.c           # Wave number in water
+    ka = k * a
+
+    # Series orders along a trailing axis; the sum is truncated per point once
+    # the phase shifts have decayed
+    n_max = _n_max(ka)
+    n = np.arange(n_max.max(initial=0) + 1)
+    x = ka[..., np.newaxis]
+    q1 = x * water.c / c_lon[..., np.newaxis]
+    q2 = x * water.c / c_trans[..., np.newaxis]
+
+    with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+        # Inside the sphere only ratios to j_n(q) enter: B1 and B2 below are
+        # divided through by j_n(q1) * j_n(q2), which leaves eta unchanged but
+        # keeps orders n > q finite, where the product itself underflows to
+        # 0 (for q ~ ka / 3 this happens well below n = ka, e.g. n ~ 374 at
+        # ka ~ 379 for tungsten carbide)
+        jd_q1, jdd_q1 = _scaled_derivatives(n, q1, _j_ratios(len(n) - 1, q1))
+        jd_q2, jdd_q2 = _scaled_derivatives(n, q2, _j_ratios(len(n) - 1, q2))
+        j_ka = spherical_jn(n, x)
+        jd_ka = spherical_jn(n, x, derivative=True)
+        y_ka = spherical_yn(n, x)
+        yd_ka = spherical_yn(n, x, derivative=True)
+
+        # Phase shift (eta_n) for each order
+        A1 = 2 * n * (n + 1) * (q1 * jd_q1 - 1)
+        A2 = (n**2 + n - 2) + q2**2 * jdd_q2
+
+        B1 = x * (A2 * q1 * jd_q1 - A1)
+        B2 = A2 * q1**2 * (beta - alpha * jdd_q1) - A1 * alpha * (1 - q2 * jd_q2)
 
-    def eta_n(l):
-        """
-        Compute phase shift (eta_n) for the nth order.
-        """
-        q1 = k * a * water.c / sphere_material.c_lon
-        q2 = k * a * water.c / sphere_material.c_trans
-
-        def jj(n, z):
-            if n == -2:
-                return -mpmath.cos(z) / z**2 - mpmath.sin(z) / z
-            elif n == -1:
-                return mpmath.cos(z) / z
-            else:
-                return mpmath.besselj(n + 0.5, z) * mpmath.sqrt(mpmath.pi / (2 * z))
-
-        def j1(n, z):
-            """
-            First derivative of spherical Bessel function of the first kind.
-            """
-            return (jj(n - 1, z) - jj(n + 1, z)) / 2 - jj(n, z) / (2 * z)
-
-        def j2(n, z):
-            """
-            Second derivative of spherical Bessel function of the first kind.
-            """
-            return (z**2 * jj(n - 2, z) - 2 * z**2 * jj(n, z) + jj(n + 2, z)
-                    - 2 * z * jj(n - 1, z) + 2 * z * jj(n + 1, z) + 3 * jj(n, z)) / (4 * z**2)
-
-        def yy(n, z):
-            if n == -1:
-                return mpmath.sin(z) / z
-            else:
-                return mpmath.bessely(n + 0.5, z) * mpmath.sqrt(mpmath.pi / (2 * z))
-
-        def y1(n, z):
-            """
-            First derivative of spherical Bessel function of the second kind.
-            """
-            return (yy(n - 1, z) - yy(n + 1, z)) / 2 - yy(n, z) / (2 * z)
-
-        A1 = 2 * l * (l + 1) * (q1 * j1(l, q1) - jj(l, q1))
-        A2 = (l**2 + l - 2) * jj(l, q2) + q2**2 * j2(l, q2)
-
-        alpha = 2 * (sphere_material.rho / water.rho) * (sphere_material.c_trans / water.c)**2
-        beta = 2 * (sphere_material.rho / water.rho) * (sphere_material.c_lon / water.c)**2 - alpha
-
-        B1 = k * a * (A2 * q1 * j1(l, q1) - A1 * jj(l, q2))
-        B2 = A2 * q1**2 * (beta * jj(l, q1) - alpha * j2(l, q1)) - A1 * alpha * (jj(l, q2) - q2 * j1(l, q2))
-
-        numerator = B2 * j1(l, k * a) - B1 * jj(l, k * a)
-        denominator = B2 * y1(l, k * a) - B1 * yy(l, k * a)
-        return mpmath.atan(-numerator / denominator)
+        numerator = B2 * jd_ka - B1 * j_ka
+        denominator = B2 * yd_ka - B1 * y_ka
+        eta = np.arctan(-numerator / denominator)
+
+        terms = (-1.0)**n * (2 * n + 1) * np.sin(eta) * np.exp(1j * eta)
+
+    # Orders above ka overflow y_n(ka) to inf, and their terms are negligible;
+    # a non-finite term at n <= ka is a real failure and leaves TS as NaN
+    in_series = n <= n_max[..., np.newaxis]
+    finite = np.isfinite(terms)
+    if np.any(in_series & ~finite & (n <= x)):
+        warnings.warn("Non-finite partial-wave terms for n <= ka; TS set to NaN", RuntimeWarning)
+    terms = np.where(in_series & (finite | (n <= x)), terms, 0)
 
     # Compute form function
-    form_function = -2.0 / (k * a) * mpmath.nsum(
-        lambda n: (-1)**n * (2 * n + 1) * mpmath.sin(eta_n(n)) * mpmath.exp(1j * eta_n(n)),
-        [0, mpmath.inf],
-    )
+    form_function = -2.0 / ka * terms.sum(axis=-1)
 
     # Compute Target Strength
-    TS = 10 * mpmath.log10(a**2 * abs(form_function)**2 / 4.0)
+    TS = 10 * np.log10(a**2 * np.abs(form_function)**2 / 4.0)
     return TS
+
+def TS_solid_sphere_batch(f, a, batch, water):
+    """
+    Calculate Target Strength (TS) of several sphere materials at once.
+
+    Parameters:
+    ----------
+    f : float or numpy.ndarray
+        Sonar frequency (kHz).
+    a : float or numpy.ndarray
+        Sphere radius (m); broadcast against `f`.
+    batch : MaterialBatch
+        Material properties as arrays, one entry per material.
+    water : object
+        Properties of the surrounding water.
+
+    Returns:
+    --------
+    TS : numpy.ndarray
+        Target Strength (dB), shape (n_materials,) + broadcast shape of `f` and `a`.
+    """
+    f, a = np.broadcast_arrays(np.asarray(f, dtype=float), np.asarray(a, dtype=float))
+
+    # Materials run along a new leading axis
+    shape = (len(batch),) + (1,) * f.ndim
+    properties = tuple(np.reshape(v, shape) for v in (batch.rho, batch.c_lon, batch.c_trans))
+    return TS_solid_sphere(f, a, properties, water)
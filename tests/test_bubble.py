@@ -26,7 +26,8 @@ try:
     
     # Test water and bubble properties
     water = seawater(temperature=10, depth=100, salinity=35)
-    bubble = air_bubble(water_class=None, T=10, z=100, S=35, diameter=0.002)  # 2mm bubble
+    bubble = air_bubble(water_class=water, T=10, z=100, S=35, diameter=0.002)  # 2mm bubble
+    assert bubble.water_class is water  # one seawater shared by water and bubble
     
     print(f"✅ Water properties:")
     print(f"    Sound speed = {water.c:.2f} m/s")
@@ -57,14 +58,8 @@ try:
     
     # Test frequency sweep
     frequencies = np.linspace(20, 100, 5)  # Small test range
-    ts_results_mc = []
-    ts_results_breathing = []
-    
-    for freq in frequencies:
-        ts_mc = float(calculate_medwin_clay_ts(f=freq, c=water.c, water=water, bubble=bubble))
-        ts_br = float(calculate_breathing_ts(f=freq, c=water.c, water=water, bubble=bubble))
-        ts_results_mc.append(ts_mc)
-        ts_results_breathing.append(ts_br)
+    ts_results_mc = calculate_medwin_clay_ts(f=frequencies, c=water.c, water=water, bubble=bubble).tolist()
+    ts_results_breathing = calculate_breathing_ts(f=frequencies, c=water.c, water=water, bubble=bubble).tolist()
     
     print(f"✅ Frequency sweep calculation successful:")
     print(f"    Medwin-Clay TS range: {min(ts_results_mc):.2f} to {max(ts_results_mc):.2f} dB")
@@ -79,18 +74,45 @@ try:
             "breathing_ts": ts_results_breathing
         }
         print("✅ I/O functions imported successfully")
-        
+
+        # The streaming writer must produce the same bytes as the pandas one
+        import tempfile
+        from Bubble.core.io_utils import export_results_csv_stream
+        # (also for a diameter array, which adds one block per diameter)
+        for d in (0.002, np.array([0.001, 0.002])):
+            sweep = run_calculations({'frequencies': frequencies, 'd': d, 'models': ['Medwin_Clay', 'Breathing'],
+                                      'T': 10, 'S': 35, 'z': 100})
+            with tempfile.TemporaryDirectory() as tmp:
+                export_results_csv(sweep, Path(tmp) / "pandas.csv")
+                export_results_csv_stream(sweep, Path(tmp) / "stream.csv")
+                assert (Path(tmp) / "pandas.csv").read_bytes() == (Path(tmp) / "stream.csv").read_bytes()
+                n_rows = len((Path(tmp) / "pandas.csv").read_text().splitlines()) - 1
+                assert n_rows == 2 * np.size(d) * len(frequencies)
+                # every row carries its diameter, also for a scalar `d`
+                import pandas as pd
+                assert set(pd.read_csv(Path(tmp) / "pandas.csv")["bubble_diameter_m"]) == set(np.atleast_1d(d))
+        print("✅ Streaming CSV export matches the pandas writer byte for byte")
+
+        # '%' in a model name or metadata value is written literally by the savetxt writer
+        from Bubble.core.io_utils import export_results_csv_fast
+        percent_results = {"params": {"frequencies": [20.0], "d": [0.002], "environment": {"note": "5%d"}},
+                           "results": {"ts": {"Model_10%": [[-60.0]]}}}
+        with tempfile.TemporaryDirectory() as tmp:
+            export_results_csv_fast(percent_results, Path(tmp) / "fast.csv")
+            assert (Path(tmp) / "fast.csv").read_text().splitlines()[1] == "20,-60,Model_10%,0.002,5%d"
+        print("✅ Fast CSV export writes '%' in text columns literally")
+
     except Exception as e:
         print(f"❌ I/O error: {e}")
     
     # Test edge cases
     try:
         # Very small bubble
-        small_bubble = air_bubble(water_class=None, T=10, z=100, S=35, diameter=0.0005)  # 0.5mm
+        small_bubble = air_bubble(water_class=water, T=10, z=100, S=35, diameter=0.0005)  # 0.5mm
         ts_small = float(calculate_medwin_clay_ts(f=test_frequency, c=water.c, water=water, bubble=small_bubble))
         
         # Larger bubble
-        large_bubble = air_bubble(water_class=None, T=10, z=100, S=35, diameter=0.004)  # 4mm
+        large_bubble = air_bubble(water_class=water, T=10, z=100, S=35, diameter=0.004)  # 4mm
         ts_large = float(calculate_medwin_clay_ts(f=test_frequency, c=water.c, water=water, bubble=large_bubble))
         
         print(f"✅ Edge case calculations:")
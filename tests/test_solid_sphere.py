@@ -56,14 +56,8 @@ try:
         
     # Test frequency sweep calculation
     frequencies = np.linspace(10, 50, 5)  # Small test range
-    ts_results_wc = []
-    ts_results_copper = []
-    
-    for freq in frequencies:
-        ts_wc = float(TS_solid_sphere(freq, test_radius, wc_material, water))
-        ts_copper = float(TS_solid_sphere(freq, test_radius, copper_material, water))
-        ts_results_wc.append(ts_wc)
-        ts_results_copper.append(ts_copper)
+    ts_results_wc = TS_solid_sphere(frequencies, test_radius, wc_material, water).tolist()
+    ts_results_copper = TS_solid_sphere(frequencies, test_radius, copper_material, water).tolist()
     
     print(f"✅ Frequency sweep calculation successful:")
     print(f"    WC TS range: {min(ts_results_wc):.2f} to {max(ts_results_wc):.2f} dB")
@@ -108,6 +102,24 @@ try:
     except Exception as e:
         print(f"❌ Edge case error: {e}")
     
+    # Test large ka (> 340), where j_n(q1) * j_n(q2) underflows for n < ka,
+    # against a 30-digit mpmath evaluation of the same series (5 cm WC sphere)
+    try:
+        import warnings
+        reference = {1800.0: -29.018213087757836,  # ka ~ 379
+                     2000.0: -30.00788413179451}   # ka ~ 421
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            ts_large_ka = TS_solid_sphere(np.array(list(reference)), 0.05, wc_material, water)
+        error = np.max(np.abs(ts_large_ka - np.array(list(reference.values()))))
+        if error < 1e-6:
+            print(f"✅ Large-ka TS matches the mpmath reference (max error {error:.1e} dB)")
+        else:
+            print(f"❌ Large-ka TS differs from the mpmath reference by {error:.2f} dB")
+
+    except Exception as e:
+        print(f"❌ Large-ka error: {e}")
+
     print("\n🎉 SolidSphere module testing complete!")
     
 except ImportError as e:
@@ -48,9 +48,27 @@ try:
     print(f"    Thermal conductivity = {bubble.K_th:.6f} W/(m·K)")
     
     # Test SeaEcho_acoustic_paras
-    from utils.SeaEcho_acoustic_paras import resonance_freq, damping_constant
+    import numpy as np
+    from utils.SeaEcho_acoustic_paras import resonance_freq, damping_constant, ResonanceModel
     f_b, f_R, corrections = resonance_freq(f=50, c=water.c, water=water, bubble=bubble)
+    # Pinned f_R at 50 kHz from the original (long double) implementation
+    model = ResonanceModel(water.c, water, bubble)
+    for f_R_model in (model(50)[1], model(np.array([20.0, 50.0]))[1][1]):
+        assert abs(f_R_model - 64769.93852435394) < 1e-12 * 64769.93852435394
     damping = damping_constant(f=50, c=water.c, water=water, bubble=bubble)
+    # Passing the resonance_freq results must not change the damping
+    assert damping_constant(f=50, c=water.c, water=water, bubble=bubble,
+                            precomputed=(f_b, f_R, corrections)) == damping
+    # f = 0 gives NaN on the scalar path too, like an array input, not ZeroDivisionError
+    with np.errstate(divide='ignore', invalid='ignore'):
+        assert np.isnan(resonance_freq(f=0, c=water.c, water=water, bubble=bubble)[1])
+        assert np.isnan(damping_constant(f=0, c=water.c, water=water, bubble=bubble))
+    # Small X (2 um bubble at 10 Hz, X ~ 0.006): d/b against a 60-digit mpmath
+    # evaluation; tiny nonzero f must stay finite on the scalar path
+    micro_model = ResonanceModel(water.c, water, air_bubble(water_class=None, T=10, z=100, S=35, diameter=2e-6))
+    for d_over_b in (micro_model(0.01)[2][1], micro_model(np.array([0.01]))[2][1][0]):
+        assert abs(d_over_b - 3.309186522140787e-07) < 1e-12 * 3.309186522140787e-07
+    assert np.isfinite(micro_model(1e-300)[1])
     print(f"✅ SeaEcho_acoustic_paras: Resonance freq = {float(f_R):.1f} Hz")
     print(f"✅ SeaEcho_acoustic_paras: Damping = {float(damping):.6f}")
     
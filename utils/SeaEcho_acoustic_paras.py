@@ -1,6 +1,191 @@
+import contextlib
+import math
 import numpy as np
 import warnings
 
+# Set to False to skip the small-bubble (ka < 1) validity check, e.g. in
+# Monte-Carlo loops that already validated their inputs
+WARN_KA = True
+
+def _sqrt(x):
+    """math.sqrt that returns NaN for negative input, like np.sqrt"""
+    return math.sqrt(x) if x >= 0 else math.nan
+
+# Below X = 1 the closed form of the thermal terms loses digits to the
+# cancellations in cosh - cos, sinh - sin and X (sinh + sin) - 2 (cosh - cos)
+# (d/b is off by ~1e-1 relative at X ~ 0.006, i.e. micron bubbles at 10 Hz);
+# their Taylor series is used there instead. Six terms of each series are
+# exact to double precision up to X ~ 3
+_X_SERIES = 1.0
+# (cosh X - cos X) / X^2, (sinh X - sin X) / X^3 and
+# [X (sinh X + sin X) - 2 (cosh X - cos X)] / X^6, as polynomials in X^4
+_CH_M_C_COEFFS = tuple(2 / math.factorial(4*k + 2) for k in range(6))
+_SH_M_S_COEFFS = tuple(2 / math.factorial(4*k + 3) for k in range(6))
+_T1_COEFFS = tuple(8 * k / math.factorial(4*k + 2) for k in range(1, 7))
+
+def _polyval_x4(coeffs, X4):
+    """Evaluate sum(coeffs[k] * X4**k) by Horner's rule"""
+    result = 0.0
+    for coeff in reversed(coeffs):
+        result = result * X4 + coeff
+    return result
+
+def _thermal_closed_form(X, gamma, tanh, exp, sin, cos):
+    """
+    d/b and the thermal term (3 gamma - 3) / X * (sinh - sin) / (cosh - cos)
+    of Eq. (8.2.28), from the closed form.
+
+    The hyperbolic terms only enter through ratios, so everything is divided
+    by cosh(X): this keeps large X (cosh overflows near 710) finite without
+    extended precision. Each transcendental is evaluated once.
+    """
+    tanh_X = tanh(X)
+    exp_X = exp(-X)
+    sech_X = 2 * exp_X / (1 + exp_X * exp_X)
+    sin_X = sin(X) * sech_X
+    cos_X = cos(X) * sech_X
+    sh_p_s = tanh_X + sin_X  # (sinh + sin) / cosh
+    sh_m_s = tanh_X - sin_X  # (sinh - sin) / cosh
+    ch_m_c = 1 - cos_X       # (cosh - cos) / cosh
+
+    temporary1 = X * sh_p_s - 2 * ch_m_c
+    temporary2 = X * X * ch_m_c + 3 * (gamma - 1) * X * sh_m_s
+    d_over_b = 3 * (gamma - 1) * temporary1 / temporary2
+    thermal = (3*gamma - 3)/X * (sh_m_s/ch_m_c)
+    return d_over_b, thermal
+
+def _thermal_series(X, gamma):
+    """
+    Same as `_thermal_closed_form`, from the Taylor series for small X.
+
+    The powers of X are divided out analytically, so nothing cancels or
+    underflows as X -> 0.
+    """
+    X2 = X * X
+    X4 = X2 * X2
+    ch_m_c = _polyval_x4(_CH_M_C_COEFFS, X4)  # (cosh - cos) / X^2
+    sh_m_s = _polyval_x4(_SH_M_S_COEFFS, X4)  # (sinh - sin) / X^3
+    temporary1 = _polyval_x4(_T1_COEFFS, X4)  # temporary1 / X^6
+
+    d_over_b = 3 * (gamma - 1) * X2 * temporary1 / (ch_m_c + 3 * (gamma - 1) * sh_m_s)
+    thermal = (3*gamma - 3) * sh_m_s / ch_m_c
+    return d_over_b, thermal
+
+class ResonanceModel():
+    """
+    Resonance frequency of one bubble with corrections for surface tension
+    and thermal conductivity (Medwin and Clay, 1997, Eq. 8.2.27),
+    specialized to one water body and bubble.
+
+    Everything that does not depend on frequency (f_b, the thermal length
+    scale of X, the surface-tension term) is computed once at construction;
+    calling the model with a frequency (array) only evaluates the
+    transcendental terms of X, e.g. for the repeated sweeps of an inversion.
+
+    Parameters:
+    -----------
+    c : float
+        Sound speed in seawater (m/s).
+    water : object
+        Seawater properties (e.g., density, pressure, etc.).
+    bubble : object
+        Bubble properties (e.g., radius, gas properties).
+    """
+    def __init__(self, c, water, bubble):
+        # Scalar bubbles keep Python floats for the math-module fast path
+        self.scalar = np.isscalar(bubble.d)
+        sqrt = _sqrt if self.scalar else np.sqrt
+        a = bubble.d / 2
+        a_cm = a * 1e2
+        self.gamma = bubble.gamma
+
+        # k*a per unit angular frequency, for the small-bubble check
+        self.ka_per_omega = a / c
+
+        # Calculate harmonic breathing frequency (f_b) of a small bubble (ka<<1)
+        # under the assumption of no surface tension, adiabatic 
+        # gas oscillations, no energy absorption. 
+        # Eq(8.2.13) in Medwin and Clay (1997)
+        self.f_b = 1/(2*np.pi*a) * sqrt(3 * bubble.gamma * water.P / water.rho)
+
+        # Correction for the effect of surface tension and
+        # thermal conductivity following Eq.(8.2.28a)-(8.2.28d), page 297
+        # Note: most of parameters are in cgs, converted once when water/bubble are built
+        # (rho_0_cgs: density of free gas at sea level, g/cm^3; Cp_cgs: specific heat
+        # at constant pressure of gas, cal/(g °C); K_th_cgs: thermal conductivity of
+        # gas, cal/(cm s °C); sigma_cgs: surface tension at gas/water interface, dyne/cm)
+        # X = X_per_sqrt_omega * sqrt(omega)
+        self.X_per_sqrt_omega = a_cm * sqrt(2 * bubble.rho_0_cgs * bubble.Cp_cgs / bubble.K_th_cgs)
+        self.surface_term = 2 * water.sigma_cgs / (water.P_cgs * a_cm)
+
+    def __call__(self, f):
+        """
+        Parameters:
+        -----------
+        f : float or numpy.ndarray
+            Sonar frequency (kHz); a whole frequency sweep is evaluated in one call.
+
+        Returns:
+        --------
+        f_b : float
+            Resonance frequency (Hz) without corrections.
+        f_R : float or numpy.ndarray
+            Resonance frequency (Hz) with corrections, with the shape of `f`.
+        correction_params : numpy.ndarray
+            Correction parameters [b, d/b, beta], shape (3,) + shape of `f`.
+        """
+        # Scalar inputs use the math module, avoiding NumPy ufunc dispatch;
+        # f = 0 (X = 0) takes the NumPy path, which gives NaN instead of raising
+        if self.scalar and np.isscalar(f) and f != 0:
+            f = float(f)
+            sqrt, tanh, exp, sin, cos, any_ = _sqrt, math.tanh, math.exp, math.sin, math.cos, bool
+            fp_guard = contextlib.nullcontext()
+            scalar_path = True
+        else:
+            f = np.asarray(f)
+            sqrt, tanh, exp, sin, cos, any_ = np.sqrt, np.tanh, np.exp, np.sin, np.cos, np.any
+            fp_guard = np.errstate(over='ignore', invalid='ignore', divide='ignore')
+            scalar_path = False
+        gamma = self.gamma
+
+        omega = 2 * np.pi * f * 1000    # radians/sec
+
+        # Check if bubble is small 
+        if WARN_KA and any_(omega * self.ka_per_omega > 1.0):
+            warnings.warn("ka < 1 not satisfied!")
+
+        # Compute X
+        X = self.X_per_sqrt_omega * sqrt(omega)
+
+        # Per-point FP warnings (e.g. f = 0) are silenced for the whole array
+        # rather than checked point by point
+        with fp_guard:
+            if scalar_path:
+                # Scalar X: only the branch that is needed is evaluated, so tiny
+                # nonzero X never divides by an underflowed closed form
+                if 0 < X < _X_SERIES:
+                    d_over_b, thermal = _thermal_series(X, gamma)
+                else:
+                    d_over_b, thermal = _thermal_closed_form(X, gamma, tanh, exp, sin, cos)
+            else:
+                # X = 0 stays on the closed form, which gives NaN
+                small = (X > 0) & (X < _X_SERIES)
+                d_over_b, thermal = _thermal_closed_form(X, gamma, tanh, exp, sin, cos)
+                if np.any(small):
+                    series = _thermal_series(np.where(small, X, 0.0), gamma)
+                    d_over_b = np.where(small, series[0], d_over_b)
+                    thermal = np.where(small, series[1], thermal)
+
+            temporary3 = (1 + d_over_b**2) * (1 + thermal)
+            b = 1/temporary3
+
+            beta = 1 + self.surface_term * (1-1/(3*gamma*b))
+
+        # Corrected resonance frequency
+        f_R = self.f_b * sqrt(b*beta)
+        correction_params = np.array([b, d_over_b, beta])
+
+        return self.f_b, f_R, correction_params
 
 def resonance_freq(f, c, water, bubble):
     """
@@ -12,8 +197,8 @@ def resonance_freq(f, c, water, bubble):
 
     Parameters:
     -----------
-    f : float
-        Sonar frequency (kHz).
+    f : float or numpy.ndarray
+        Sonar frequency (kHz); a whole frequency sweep is evaluated in one call.
     c : float
         Sound speed in seawater (m/s).
     water : object
@@ -26,74 +211,21 @@ def resonance_freq(f, c, water, bubble):
     f_b : float
         Resonance frequency (Hz) without corrections, under the assumption 
         of no surface tension, adiabatic gas oscillations, no energy absorption.
-    f_R : float
+    f_R : float or numpy.ndarray
         Resonance frequency (Hz) with corrections for surface tension and
-        thermal conductivity.
+        thermal conductivity, with the shape of `f`.
     correction_params : numpy.ndarray
-        Correction parameters [b, d/b, beta].
+        Correction parameters [b, d/b, beta], shape (3,) + shape of `f`.
     """
-    omega = 2 * np.pi * f * 1000    # radians/sec
-    k = omega/c
-    a = bubble.d/2
-    
-    # Check if bubble is small 
-    if k*a > 1.0:
-        warnings.warn("ka < 1 not satisfied!")
-    
-    # Calculate harmonic breathing frequency (f_b) of a small bubble (ka<<1)
-    # under the assumption of no surface tension, adiabatic 
-    # gas oscillations, no energy absorption. 
-    # Eq(8.2.13) in Medwin and Clay (1997)
-    f_b = 1/(2*np.pi*a) * np.sqrt(3 * bubble.gamma * water.P / water.rho)
-    
-    # Correction for the effect of surface tension and
-    # thermal conductivity following Eq.(8.2.28a)-(8.2.28d), page 297
-    # Note: most of parameters are in cgs
-    P_in_dynes_per_cm2 = water.P * 10
-    rho_g_A = bubble.rho_0*1e-3 # g/cm^3, density of free gas at sea level 
-    Cpg = bubble.Cp * 0.2388 # specific heat at constant pressure of gas, convert KJ/(kg K) to cal/(g °C) 
-    Kg = bubble.K_th * 0.0023900573613766683 # thermal conductivity of gas, convert W/(m K) to cal/(cm s °C), 
-    tau = water.sigma * 1e3 # surface tension at gas/water interface, convert N/m to dyne/cm
-    
-    # Compute X with highest available precision
-    X = a * 1e2 * (2*omega * rho_g_A * Cpg/Kg)**(0.5)
-    
-    # Use highest precision available on this system
-    try:
-        X = np.float128(X)  # Use float128 if available
-    except AttributeError:
-        try:
-            X = np.longdouble(X)  # Fall back to longdouble
-        except:
-            X = np.float64(X)  # Fall back to float64 if necessary
-    
-    # Corrections for surface tension and thermal conductivity with high precision
-    temporary1 = X * (np.sinh(X) + np.sin(X)) - 2 * (np.cosh(X) - np.cos(X))
-    temporary2 = X**2 * (np.cosh(X) - np.cos(X)) + \
-        3 * (bubble.gamma - 1) * X * (np.sinh(X) - np.sin(X))
-    
-    d_over_b = 3 * (bubble.gamma - 1) * temporary1 / temporary2
-    
-    temporary3 = (1 + d_over_b**2) * \
-         (1 + (3*bubble.gamma - 3)/X * \
-         ((np.sinh(X)-np.sin(X))/(np.cosh(X)-np.cos(X))))
-    b = 1/temporary3
-    
-    beta = 1 + 2 * tau / (P_in_dynes_per_cm2 * a * 1e2) * (1-1/(3*bubble.gamma*b))
-    
-    # Corrected resonance frequency
-    f_R = f_b * np.sqrt(b*beta)
-    correction_params = np.array([b, d_over_b, beta])
+    return ResonanceModel(c, water, bubble)(f)
 
-    return f_b, f_R, correction_params
-
-def damping_constant(f, c, water, bubble):
+def damping_constant(f, c, water, bubble, precomputed=None):
     """ 
     Compute damping constant of bubbles using Medwin and Clay (1998).
 
     Parameters:
     -----------
-    f : float
+    f : float or numpy.ndarray
         Sonar frequency (kHz).
     c : float
         Sound speed in seawater (m/s).
@@ -101,28 +233,79 @@ def damping_constant(f, c, water, bubble):
         Seawater properties.
     bubble : object
         Bubble properties.
+    precomputed : tuple, optional
+        (f_b, f_R, correction_params) already returned by `resonance_freq`
+        for the same f, water and bubble; avoids evaluating it twice.
     
     Returns:
     --------
-    float
+    float or numpy.ndarray
         Total damping constant (delta).
     """
-    # Convert all inputs to high precision floats
-    f = np.float64(f)
-    c = np.float64(c)
-    omega = np.float64(2 * np.pi * f * 1000)  # Radians/sec
-    a = np.float64(bubble.d / 2)
+    # Scalars stay Python floats so the arithmetic below skips NumPy dispatch
+    # (except f = 0, which divides by zero and must give NaN/inf as for arrays)
+    f = float(f) if np.isscalar(f) and f != 0 else np.asarray(f)
+    omega = 2 * np.pi * f * 1000  # Radians/sec
+    a = bubble.d / 2
 
-    # Compute resonance frequencies with full precision
-    f_b, f_R, correction_params = resonance_freq(f, c, water, bubble)
+    # Compute resonance frequencies, unless the caller already has them
+    if precomputed is None:
+        precomputed = resonance_freq(f, c, water, bubble)
+    f_b, f_R, correction_params = precomputed
 
     # Compute damping components
     delta_r = omega * a / c  # Re-radiation damping
     delta_t = correction_params[1] * (f_R / (f * 1000))**2  # Thermal damping
     delta_nu = 4 * water.mu / (water.rho * omega * a**2)  # Viscous damping
 
-    return np.float64(delta_r + delta_t + delta_nu)
+    return delta_r + delta_t + delta_nu
+
+
+class AbsorptionModel():
+    """
+    Absorption coefficient in seawater from the simplified equation of
+    Ainslie and McColm (1998), specialized to one water body.
+
+    The relaxation frequencies and the T/S/pH/z-dependent prefactors are
+    computed once at construction; calling the model with a frequency
+    (array) only evaluates the frequency-dependent terms.
+
+    Parameters:
+    -----------
+    water : object
+        Seawater properties (requires T, S, pH, z attributes)
+    """
+    def __init__(self, water):
+        T = water.T
+        S = water.S
+        pH = water.pH
+        z = water.z / 1000  # convert m to km
+
+        # Boric acid and magnesium sulphate relaxation frequencies (kHz)
+        self.f1 = 0.78 * np.sqrt(S/35.0) * np.exp(T/26.0)
+        self.f2 = 42.0 * np.exp(T/17.0)
 
+        # Boric acid, magnesium sulphate and pure water prefactors
+        self.A = 0.106 * self.f1 * np.exp((pH-8.0)/0.56)
+        self.B = 0.52 * (1 + T/43.0) * (S/35.0) * self.f2 * np.exp(-z/6.0)
+        self.C = 0.00049 * np.exp(-(T/27.0 + z/17.0))
+
+    def __call__(self, f):
+        """
+        Parameters:
+        -----------
+        f : float or array-like
+            Frequency in kHz
+
+        Returns:
+        --------
+        alpha : float or array-like
+            Absorption coefficient in dB/km
+        """
+        f_sq = np.square(f)
+        return (self.A * f_sq / (f_sq + self.f1**2)
+                + self.B * f_sq / (f_sq + self.f2**2)
+                + self.C * f_sq)
 
 def absorption_coeff(f, water):
     """
@@ -142,16 +325,5 @@ def absorption_coeff(f, water):
     alpha : float or array-like
         Absorption coefficient in dB/km
     """
-    T = water.T
-    S = water.S
-    pH = water.pH
-    z = water.z / 1000  # convert m to km
-    
-    f1 = 0.78 * np.sqrt(S/35.0) * np.exp(T/26.0)
-    f2 = 42.0 * np.exp(T/17.0)
-    
-    alpha = 0.106 * (f1 * f**2)/(f**2+f1**2) * np.exp((pH-8.0)/0.56) +\
-            0.52 * (1 + T/43.0) * (S/35.0) * f2 * f**2 / (f**2 + f2**2) * np.exp(-z/6.0) \
-            + 0.00049 * f**2 * np.exp(-(T/27.0 + z/17.0))
-            
+    alpha = AbsorptionModel(water)(f)
     return alpha
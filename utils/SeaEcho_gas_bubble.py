@@ -14,6 +14,10 @@ from .SeaEcho_water import seawater
 g = 9.81
 R = 8.31446261815324 # Gas constant, (J/(mol K))
 
+# Flat record layout of the scalar bubble properties (see air_bubble.as_record)
+BUBBLE_DTYPE = np.dtype([('d', 'f8'), ('rho', 'f8'), ('rho_0', 'f8'), ('gamma', 'f8'),
+                         ('Pg', 'f8'), ('Mm', 'f8'), ('Cp', 'f8'), ('K_th', 'f8')])
+
 
 class air_bubble():
     """
@@ -27,6 +31,9 @@ class air_bubble():
            Mm - Molecular mass (kg/mol)
            Cp - specific heat capacity (kJ/(kg K))
          K_th - thermal conductivity (W/(m K))
+    rho_0_cgs - rho_0 in cgs (g/cm^3)
+       Cp_cgs - Cp in cgs (cal/(g °C))
+     K_th_cgs - K_th in cgs (cal/(cm s °C))
          
          Note: the value of thermal conductivity is from
                Eq.7 from Stephan and Laesecke (1985):
@@ -34,16 +41,20 @@ class air_bubble():
                
     """
     def __init__(self, water_class, T, z, S, diameter):
-        self.water_class = water_class
+        # Reuse the caller's seawater; build one from (T, z, S) only if none is given
+        self.water_class = water_class if water_class is not None else seawater(T, z, S)
         
         self.d = diameter
         self.Mm = 28.96e-3          
         self.K_th = 4.358e-3
         self.Cp = 1.005 # Note: 1.005 kJ/(kg K) = 0.24 cal/(g degC)
-        self.Pg = self.pressure_and_density()[0]
-        self.rho = self.pressure_and_density()[1]
-        self.rho_0 = self.pressure_and_density()[2]
+        self.Pg, self.rho, self.rho_0 = self.pressure_and_density()
         self.gamma = 1.4
+
+        # cgs values used by the resonance corrections in SeaEcho_acoustic_paras
+        self.rho_0_cgs = self.rho_0 * 1e-3                 # g/cm^3
+        self.Cp_cgs = self.Cp * 0.2388                     # cal/(g °C)
+        self.K_th_cgs = self.K_th * 0.0023900573613766683  # cal/(cm s °C)
         
     def pressure_and_density(self):
         Pg = 1.01e5 + self.water_class.rho * g * self.water_class.z + \
@@ -53,6 +64,14 @@ class air_bubble():
         rho_0 = 1.01e5 * self.Mm / (R * (20 + 273.15)) # 20 deg C
         return Pg, rho, rho_0
 
+    def as_record(self):
+        """
+        Return the properties of a single-diameter bubble as one
+        BUBBLE_DTYPE structured scalar (rec['d'], rec['Pg'], ...).
+        """
+        return np.array(tuple(getattr(self, name) for name in BUBBLE_DTYPE.names),
+                        dtype=BUBBLE_DTYPE)
+
 class methane_bubble():
     """
     Parameters:
@@ -65,6 +84,9 @@ class methane_bubble():
            Mm - Molecular mass (kg/mol)
            Cp - specific heat capacity (kJ/(kg K))
          K_th - thermal conductivity (W/(m K))
+    rho_0_cgs - rho_0 in cgs (g/cm^3)
+       Cp_cgs - Cp in cgs (cal/(g °C))
+     K_th_cgs - K_th in cgs (cal/(cm s °C))
          
     Notes:
       • Values are representative for ~20–25 °C, 1 atm.
@@ -79,7 +101,8 @@ class methane_bubble():
        VDI Wärmeatlas / Lemmon & Jacobsen correlations
     """
     def __init__(self, water_class, T, z, S, diameter):
-        self.water_class = water_class
+        # Reuse the caller's seawater; build one from (T, z, S) only if none is given
+        self.water_class = water_class if water_class is not None else seawater(T, z, S)
 
         self.d = diameter
         self.Mm = 16.04e-3         # kg/mol (CH4)
@@ -88,9 +111,22 @@ class methane_bubble():
         self.Pg, self.rho, self.rho_0 = self.pressure_and_density()
         self.gamma = 1.31          # Cp/Cv at ~300 K
 
+        # cgs values used by the resonance corrections in SeaEcho_acoustic_paras
+        self.rho_0_cgs = self.rho_0 * 1e-3                 # g/cm^3
+        self.Cp_cgs = self.Cp * 0.2388                     # cal/(g °C)
+        self.K_th_cgs = self.K_th * 0.0023900573613766683  # cal/(cm s °C)
+
     def pressure_and_density(self):
         Pg = 1.01e5 + self.water_class.rho * g * self.water_class.z + \
                 2*self.water_class.sigma/(self.d/2) - self.water_class.Pv
         rho = Pg * self.Mm / (R * (self.water_class.T + 273.15))
         rho_0 = 1.01e5 * self.Mm / (R * (20 + 273.15))  # 20 °C reference
-        return Pg, rho, rho_0
\ No newline at end of file
+        return Pg, rho, rho_0
+
+    def as_record(self):
+        """
+        Return the properties of a single-diameter bubble as one
+        BUBBLE_DTYPE structured scalar (rec['d'], rec['Pg'], ...).
+        """
+        return np.array(tuple(getattr(self, name) for name in BUBBLE_DTYPE.names),
+                        dtype=BUBBLE_DTYPE)
\ No newline at end of file
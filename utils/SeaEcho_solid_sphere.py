@@ -1,3 +1,8 @@
+from dataclasses import dataclass
+import numpy as np
+from utils import DATACLASS_SLOTS
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Tungsten_carbide:
     """
     Properties of Tungsten carbide solid sphere.
@@ -8,11 +13,11 @@ class Tungsten_carbide:
     c_lon - longitudinal sound speed (m/s)
     c_trans - transverse sound speed (m/s)
     """
-    def __init__(self):
-        self.rho = 14900
-        self.c_lon = 6853
-        self.c_trans = 4171
+    rho: float = 14900
+    c_lon: float = 6853
+    c_trans: float = 4171
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Copper:
     """
     Properties of copper (solid, ~25 °C).
@@ -25,11 +30,11 @@ class Copper:
     c_lon     - longitudinal sound speed (m/s)
     c_trans   - transverse (shear) sound speed (m/s)  [annealed]
     """
-    def __init__(self):
-        self.rho = 8940       # kg/m^3
-        self.c_lon = 4660     # m/s  
-        self.c_trans = 2325   # m/s
+    rho: float = 8940       # kg/m^3
+    c_lon: float = 4660     # m/s
+    c_trans: float = 2325   # m/s
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Aluminum:
     """
     Properties of aluminum.
@@ -37,11 +42,11 @@ class Aluminum:
     Sources:
     - Target Strength Package V1.1 
     """
-    def __init__(self):
-        self.rho = 2700       # kg/m^3
-        self.c_lon = 6260     # m/s  
-        self.c_trans = 3080   # m/s
+    rho: float = 2700       # kg/m^3
+    c_lon: float = 6260     # m/s
+    c_trans: float = 3080   # m/s
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Stainless_steel:
     """
     Properties of stainless steel.
@@ -49,7 +54,41 @@ class Stainless_steel:
     Sources:
     - Target Strength Package V1.1 
     """
-    def __init__(self):
-        self.rho = 7800       # kg/m^3
-        self.c_lon = 5610     # m/s  
-        self.c_trans = 3120   # m/s
\ No newline at end of file
+    rho: float = 7800       # kg/m^3
+    c_lon: float = 5610     # m/s
+    c_trans: float = 3120   # m/s
+
+@dataclass(frozen=True)
+class MaterialBatch:
+    """
+    Several materials stored as one array per property (structure of arrays),
+    for sweeping TS over materials and frequencies in one call.
+
+    Parameters:
+    -------------------------------------
+    rho     - densities (kg/m^3)
+    c_lon   - longitudinal sound speeds (m/s)
+    c_trans - transverse sound speeds (m/s)
+    """
+    rho: np.ndarray
+    c_lon: np.ndarray
+    c_trans: np.ndarray
+
+    @classmethod
+    def from_materials(cls, materials):
+        """Stack the properties of material objects into float64 arrays"""
+        materials = list(materials)
+        return cls(
+            rho=np.array([m.rho for m in materials], dtype=float),
+            c_lon=np.array([m.c_lon for m in materials], dtype=float),
+            c_trans=np.array([m.c_trans for m in materials], dtype=float),
+        )
+
+    def __len__(self):
+        return len(self.rho)
+
+# Shared instances; the materials are immutable, so one of each suffices
+TUNGSTEN_CARBIDE = Tungsten_carbide()
+COPPER = Copper()
+ALUMINUM = Aluminum()
+STAINLESS_STEEL = Stainless_steel()
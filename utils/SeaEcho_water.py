@@ -11,10 +11,17 @@ Reference: TAMOC model.
 """
 
 import numpy as np
+from functools import lru_cache
 
 g = 9.81
 R = 8.31446261815324 # Gas constant, (J/(mol K))
 
+# Flat record layout of the scalar seawater properties (see seawater.as_record)
+WATER_DTYPE = np.dtype([('P', 'f8'), ('Pv', 'f8'), ('T', 'f8'), ('z', 'f8'),
+                        ('S', 'f8'), ('rho', 'f8'), ('nu', 'f8'), ('mu', 'f8'),
+                        ('k', 'f8'), ('cp', 'f8'), ('sigma', 'f8'), ('c', 'f8'),
+                        ('pH', 'f8')])
+
 class seawater():
         """
         Parameters:
@@ -32,6 +39,8 @@ class seawater():
             sigma - surface tension (N/m)
                 c - sound speed (m/s)
                pH - pH value of water
+            P_cgs - pressure in cgs (dyne/cm^2)
+        sigma_cgs - surface tension in cgs (dyne/cm)
         
         """
         def __init__(self, temperature = 22, depth = 0, salinity = 0, pH = 8.0):
@@ -50,6 +59,10 @@ class seawater():
             self.Pv = self.vapor_pressure()
             self.c = self.sound_speed()
             
+            # cgs values used by the bubble resonance corrections
+            self.P_cgs = self.P * 10            # dyne/cm^2
+            self.sigma_cgs = self.sigma * 1e3   # dyne/cm
+            
 
 
         def density(self):
@@ -185,7 +198,22 @@ class seawater():
             c = 1449.2 + 4.6 * self.T - 0.055 * self.T**2 + 0.00029 * self.T**3 \
                 + (1.34 - 0.01 * self.T) * (self.S - 35) + 0.016 * self.z
             return c
-        
-        
-            
-            
\ No newline at end of file
+
+        def as_record(self):
+            """
+            Return the properties as one WATER_DTYPE structured scalar, so
+            array kernels can read them as rec['rho'] etc.
+            """
+            return np.array(tuple(getattr(self, name) for name in WATER_DTYPE.names),
+                            dtype=WATER_DTYPE)
+
+
+@lru_cache(maxsize=128)
+def get_seawater(temperature = 22, depth = 0, salinity = 0, pH = 8.0):
+    """
+    Return a shared seawater instance for the given conditions.
+
+    Instances are cached on (temperature, depth, salinity, pH), so the
+    returned object must be treated as read-only.
+    """
+    return seawater(temperature, depth, salinity, pH)
@@ -7,5 +7,9 @@ This package contains utility modules for:
 - SeaEcho_solid_sphere: Solid sphere material properties
 - SeaEcho_acoustic_paras: Acoustic parameters including resonance frequency, damping, and absorption calculations
 """
+import sys
 
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
+
+# dataclass(**DATACLASS_SLOTS) adds __slots__; slots=True needs Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
\ No newline at end of file